@@ -76,8 +76,11 @@ def export(dst_format, project_id=None, task_id=None, job_id=None, server_url=No
             tasks_update = list(map(lambda db_task: timezone.localtime(
                 db_task.updated_date).timestamp(), db_instance.tasks.all()))
             instance_time = max(tasks_update + [instance_time])
-        if not (osp.exists(output_path) and \
-                instance_time <= osp.getmtime(output_path)):
+        try:
+            cached_file_mtime = osp.getmtime(output_path)
+        except FileNotFoundError:
+            cached_file_mtime = None
+        if cached_file_mtime is None or cached_file_mtime < instance_time:
             os.makedirs(cache_dir, exist_ok=True)
             with tempfile.TemporaryDirectory(dir=cache_dir) as temp_dir:
                 temp_file = osp.join(temp_dir, 'result')
@@ -128,7 +131,12 @@ def export_project_annotations(project_id, dst_format=None, server_url=None):
 
 def clear_export_cache(file_path, file_ctime, logger):
     try:
-        if osp.exists(file_path) and osp.getctime(file_path) == file_ctime:
+        try:
+            cached_file_ctime = osp.getctime(file_path)
+        except FileNotFoundError:
+            return
+
+        if cached_file_ctime == file_ctime:
             os.remove(file_path)
 
             logger.info(
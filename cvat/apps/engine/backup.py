@@ -16,6 +16,7 @@ from datetime import datetime
 from tempfile import mkstemp
 
 import django_rq
+import rq
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
@@ -754,8 +755,11 @@ def _create_backup(db_instance, Exporter, output_path, logger, cache_ttl):
         output_path = os.path.join(cache_dir, output_path)
 
         instance_time = timezone.localtime(db_instance.updated_date).timestamp()
-        if not (os.path.exists(output_path) and \
-                instance_time <= os.path.getmtime(output_path)):
+        try:
+            cached_file_mtime = os.path.getmtime(output_path)
+        except FileNotFoundError:
+            cached_file_mtime = None
+        if cached_file_mtime is None or cached_file_mtime < instance_time:
             os.makedirs(cache_dir, exist_ok=True)
             with tempfile.TemporaryDirectory(dir=cache_dir) as temp_dir:
                 temp_file = os.path.join(temp_dir, 'dump')
@@ -824,7 +828,10 @@ def export(db_instance, request, queue_name):
             rq_job.cancel()
             rq_job.delete()
         else:
-            if rq_job.is_finished:
+            # fetch_job() has just loaded the whole job hash from Redis,
+            # so there is no need to request the status once again
+            rq_job_status = rq_job.get_status(refresh=False)
+            if rq_job_status == rq.job.JobStatus.FINISHED:
                 file_path = rq_job.return_value
                 if action == "download" and os.path.exists(file_path):
                     rq_job.delete()
@@ -861,7 +868,7 @@ def export(db_instance, request, queue_name):
                 else:
                     if os.path.exists(file_path):
                         return Response(status=status.HTTP_201_CREATED)
-            elif rq_job.is_failed:
+            elif rq_job_status == rq.job.JobStatus.FAILED:
                 exc_info = str(rq_job.exc_info)
                 rq_job.delete()
                 return Response(exc_info,
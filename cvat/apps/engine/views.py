@@ -15,6 +15,7 @@ from tempfile import mkstemp
 from django.db.models.query import Prefetch
 from django.shortcuts import get_object_or_404
 import django_rq
+import rq
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -2268,7 +2269,10 @@ def _export_annotations(db_instance, rq_id, request, format_name, action, callba
             rq_job.cancel()
             rq_job.delete()
         else:
-            if rq_job.is_finished:
+            # fetch_job() has just loaded the whole job hash from Redis,
+            # so there is no need to request the status once again
+            rq_job_status = rq_job.get_status(refresh=False)
+            if rq_job_status == rq.job.JobStatus.FINISHED:
                 file_path = rq_job.return_value
                 if action == "download" and osp.exists(file_path):
                     rq_job.delete()
@@ -2310,7 +2314,7 @@ def _export_annotations(db_instance, rq_id, request, format_name, action, callba
                 else:
                     if osp.exists(file_path):
                         return Response(status=status.HTTP_201_CREATED)
-            elif rq_job.is_failed:
+            elif rq_job_status == rq.job.JobStatus.FAILED:
                 exc_info = str(rq_job.exc_info)
                 rq_job.delete()
                 return Response(exc_info,